@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark
+Compares eager and lazy startup for short-lived invocations
+"""
+
+import os
+import sys
+import argparse
+import subprocess
+from typing import List, Tuple
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Reproduces the original startup: typing imported by every module, every
+# package class imported eagerly and the default menu built and validated
+# before the menu file replaces it
+EAGER_SNIPPET = (
+    "import time\n"
+    "start = time.perf_counter()\n"
+    "import typing\n"
+    "import src.pizza_types, src.pizza_order, src.pizza_interface\n"
+    "app = src.pizza_interface.PizzaInterface()\n"
+    "app.menu.count()\n"
+    "app.menu.load_from_file(app.menu_file)\n"
+    "print(int((time.perf_counter() - start) * 1000000))\n"
+)
+
+# Current startup as done by pizza_manager.py and PizzaInterface.run()
+LAZY_SNIPPET = (
+    "import time\n"
+    "start = time.perf_counter()\n"
+    "from src.pizza_interface import PizzaInterface\n"
+    "app = PizzaInterface()\n"
+    "app.menu.load_from_file(app.menu_file)\n"
+    "app.menu.count()\n"
+    "print(int((time.perf_counter() - start) * 1000000))\n"
+)
+
+def parse_importtime(stderr: str) -> int:
+    """Sum the cumulative '-X importtime' microseconds of top-level imports
+
+    Nested imports are already included in their parent's cumulative time,
+    so the sum covers every module imported by the process exactly once.
+    """
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3:
+            continue
+
+        # Nested modules are indented after the separator
+        if parts[2].startswith('  '):
+            continue
+
+        try:
+            total += int(parts[1].strip())
+        except ValueError:
+            continue  # Header line
+    return total
+
+def run_startup(snippet: str) -> Tuple[int, int]:
+    """Run one fresh interpreter and return its total import and startup times"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', snippet],
+        cwd=PROJECT_DIR, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        universal_newlines=True, check=True
+    )
+    return parse_importtime(result.stderr), int(result.stdout.strip())
+
+def median(values: List[int]) -> int:
+    """Median of a non-empty list"""
+    ordered = sorted(values)
+    return ordered[len(ordered) // 2]
+
+def main():
+    """Main entry point for the startup benchmark"""
+    parser = argparse.ArgumentParser(description="Measure pizza_manager startup time")
+    parser.add_argument('-n', '--runs', type=int, default=20,
+                        help="number of interpreter runs per scenario (default: 20)")
+    args = parser.parse_args()
+
+    # Interleave the scenarios so system noise affects both equally
+    eager, lazy = [], []
+    for _ in range(args.runs):
+        eager.append(run_startup(EAGER_SNIPPET))
+        lazy.append(run_startup(LAZY_SNIPPET))
+
+    # Only end-to-end numbers are compared: per-module cumulative times
+    # depend on import order and differ between the two scenarios
+    eager_imports = median([imports for imports, _ in eager])
+    lazy_imports = median([imports for imports, _ in lazy])
+    eager_total = median([total for _, total in eager])
+    lazy_total = median([total for _, total in lazy])
+
+    print(f"{'Measurement':<25} {'Eager (us)':<12} {'Lazy (us)':<12}")
+    print("-" * 50)
+    print(f"{'all imports (importtime)':<25} {eager_imports:<12} {lazy_imports:<12}")
+    print(f"{'import + menu load':<25} {eager_total:<12} {lazy_total:<12}")
+    print(f"\nMedian of {args.runs} runs")
+
+if __name__ == "__main__":
+    main()
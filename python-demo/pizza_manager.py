@@ -5,11 +5,9 @@ A secure Python implementation for managing pizza orders and bill splitting
 """
 
 import sys
-import os
-
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
+# The script directory is already on sys.path, so the package resolves
+# directly; importing the submodule avoids loading unrelated modules
 from src.pizza_interface import PizzaInterface
 
 def main():
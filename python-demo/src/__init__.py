@@ -3,11 +3,40 @@ Pizza Management System Package
 Secure Python implementation for pizza order management
 """
 
+import importlib
+
 __version__ = "1.0.0"
 __author__ = "Pizza Management Team"
 
-from .pizza_types import PizzaType, PizzaMenu
-from .pizza_order import OrderItem, PizzaOrder
-from .pizza_interface import PizzaInterface
+# Public names are resolved on first access so that importing a single
+# submodule (as pizza_manager.py does) does not pull in the whole package
+_LAZY_ATTRS = {
+    'PizzaType': '.pizza_types',
+    'PizzaMenu': '.pizza_types',
+    'OrderItem': '.pizza_order',
+    'PizzaOrder': '.pizza_order',
+    'PizzaInterface': '.pizza_interface',
+    'MenuRegistry': '.menu_registry',
+    'SyncReport': '.catalog_sync',
+    'sync_catalog': '.catalog_sync',
+    'Quote': '.quote_cache',
+    'QuoteCache': '.quote_cache',
+}
+
+__all__ = ['PizzaType', 'PizzaMenu', 'OrderItem', 'PizzaOrder', 'PizzaInterface',
+           'MenuRegistry', 'SyncReport', 'sync_catalog',
+           'Quote', 'QuoteCache']
+
+def __getattr__(name: str):
+    """Import public classes lazily on first attribute access"""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
-__all__ = ['PizzaType', 'PizzaMenu', 'OrderItem', 'PizzaOrder', 'PizzaInterface']
+def __dir__():
+    """List module attributes including not yet imported classes"""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,230 @@
+"""
+Catalog Sync Module
+Applies supplier catalog exports to a pizza menu as a delta
+"""
+
+import os
+import csv
+import json
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from .pizza_types import PizzaType, PizzaMenu, MAX_PIZZA_TYPES
+
+# Security constants
+MAX_CATALOG_FILE_SIZE = 16 * 1024 * 1024  # 16MB limit
+MAX_CATALOG_ROW_LENGTH = 1000
+
+CATALOG_FORMATS = ('.csv', '.jsonl')
+REQUIRED_COLUMNS = ('name', 'price')
+
+_TRUE_VALUES = ('true', '1', 'yes', 'y')
+_FALSE_VALUES = ('false', '0', 'no', 'n')
+
+class SyncReport:
+    """Summary of the changes applied by a catalog sync"""
+    
+    def __init__(self):
+        self.added: List[str] = []
+        self.removed: List[str] = []
+        self.updated: List[str] = []
+        self.unchanged = 0
+        self.skipped = 0
+        self.unreadable = 0
+        self.removals_skipped = False
+        self.saved = False
+    
+    def has_changes(self) -> bool:
+        """Check if the sync changed the menu"""
+        return bool(self.added or self.removed or self.updated)
+    
+    def to_dict(self) -> Dict:
+        """Convert to dictionary"""
+        return {
+            'added': list(self.added),
+            'removed': list(self.removed),
+            'updated': list(self.updated),
+            'unchanged': self.unchanged,
+            'skipped': self.skipped,
+            'unreadable': self.unreadable,
+            'removals_skipped': self.removals_skipped,
+            'saved': self.saved
+        }
+    
+    def display(self):
+        """Display sync summary"""
+        print("\n=== Catalog Sync Results ===")
+        print(f"Added: {len(self.added)}")
+        print(f"Removed: {len(self.removed)}")
+        print(f"Updated: {len(self.updated)}")
+        print(f"Unchanged: {self.unchanged}")
+        print(f"Skipped (invalid or duplicate): {self.skipped}")
+        print(f"Unreadable rows: {self.unreadable}")
+        if self.removals_skipped:
+            print("Removals skipped: catalog was incomplete or unreadable")
+
+def _parse_available(value) -> Optional[bool]:
+    """Parse an availability flag from CSV text or JSON, None when missing"""
+    if value is None or str(value).strip() == '':
+        return None
+    
+    if isinstance(value, bool):
+        return value
+    
+    text = str(value).strip().lower()
+    if text in _TRUE_VALUES:
+        return True
+    if text in _FALSE_VALUES:
+        return False
+    
+    raise ValueError("Invalid availability value")
+
+def _read_catalog_rows(filename: str) -> Iterator[Optional[Dict]]:
+    """Yield catalog rows as dictionaries, or None for unreadable rows"""
+    extension = os.path.splitext(filename)[1].lower()
+    
+    # utf-8-sig drops the byte order mark many spreadsheet exports start with
+    with open(filename, 'r', encoding='utf-8-sig', newline='') as f:
+        if extension == '.csv':
+            reader = csv.DictReader(f)
+            if reader.fieldnames:
+                reader.fieldnames = [str(column).strip().lower()
+                                     for column in reader.fieldnames]
+            
+            missing = [column for column in REQUIRED_COLUMNS
+                       if column not in (reader.fieldnames or [])]
+            if missing:
+                raise ValueError(f"Catalog is missing required columns: {', '.join(missing)}")
+            
+            for row in reader:
+                if sum(len(str(value)) for value in row.values()) > MAX_CATALOG_ROW_LENGTH:
+                    yield None
+                    continue
+                
+                yield row
+        else:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                
+                if len(line) > MAX_CATALOG_ROW_LENGTH:
+                    yield None
+                    continue
+                
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    yield None
+                    continue
+                
+                yield row if isinstance(row, dict) else None
+
+def _diff_catalog(current: Dict[str, PizzaType], catalog_file: str,
+                  report: SyncReport) -> Tuple[Set[str], int, List[PizzaType], List]:
+    """Compare catalog rows with the current pizzas without changing anything"""
+    seen = set()
+    valid_rows = 0
+    additions: List[PizzaType] = []
+    updates = []
+    
+    for row in _read_catalog_rows(catalog_file):
+        if (row is None or not isinstance(row.get('name'), str) or
+                row.get('price') is None):
+            report.unreadable += 1
+            continue
+        
+        key = row['name'].lower().strip()
+        if key in seen:
+            report.skipped += 1
+            continue
+        
+        # Mark seen before validation so an invalid row never removes a pizza
+        seen.add(key)
+        
+        raw_price = str(row['price']).strip()
+        existing = current.get(key)
+        try:
+            # A missing flag keeps the current availability; new pizzas default to available
+            available = _parse_available(row.get('available'))
+            if available is None:
+                available = existing.available if existing is not None else True
+            
+            # Unchanged rows skip validation entirely
+            if (existing is not None and raw_price == str(existing.price) and
+                    available == existing.available):
+                report.unchanged += 1
+                valid_rows += 1
+                continue
+            
+            pizza = PizzaType(row['name'], raw_price, available)
+        except ValueError:
+            report.skipped += 1
+            continue
+        
+        valid_rows += 1
+        if existing is None:
+            additions.append(pizza)
+        elif pizza.price != existing.price or pizza.available != existing.available:
+            updates.append((existing, pizza))
+        else:
+            report.unchanged += 1
+    
+    return seen, valid_rows, additions, updates
+
+def sync_catalog(menu: PizzaMenu, catalog_file: str,
+                 menu_file: Optional[str] = None) -> SyncReport:
+    """Sync a menu with a full CSV or JSONL catalog export
+    
+    Rows are matched to existing pizzas by normalized name. Only new or
+    changed rows are validated, and the menu file is only rewritten when
+    the sync changed something. Pizzas missing from the catalog are only
+    removed when every row could be read and at least one row was valid.
+    """
+    if not menu._is_safe_path(catalog_file):
+        raise ValueError("Invalid file path")
+    
+    if os.path.splitext(catalog_file)[1].lower() not in CATALOG_FORMATS:
+        raise ValueError("Unsupported catalog format (use .csv or .jsonl)")
+    
+    report = SyncReport()
+    current = {pizza.name.lower().strip(): pizza for pizza in menu.pizzas}
+    
+    try:
+        # Check file size (prevent DoS)
+        if os.path.getsize(catalog_file) > MAX_CATALOG_FILE_SIZE:
+            raise ValueError("File too large")
+        
+        seen, valid_rows, additions, updates = _diff_catalog(current, catalog_file, report)
+    except (OSError, csv.Error, UnicodeDecodeError) as e:
+        raise ValueError(f"Could not read catalog: {e}")
+    
+    # An empty, truncated or malformed export must not wipe the menu
+    if valid_rows == 0 or report.unreadable > 0:
+        removals = []
+        report.removals_skipped = any(key not in seen for key in current)
+    else:
+        removals = [pizza for key, pizza in current.items() if key not in seen]
+    
+    # Apply nothing unless the whole delta fits the menu limits
+    if len(current) - len(removals) + len(additions) > MAX_PIZZA_TYPES:
+        raise ValueError(f"Maximum number of pizza types ({MAX_PIZZA_TYPES}) reached")
+    
+    for existing, pizza in updates:
+        existing.price = pizza.price
+        existing.available = pizza.available
+        report.updated.append(existing.name)
+    
+    if removals:
+        removed_ids = {id(pizza) for pizza in removals}
+        menu.pizzas = [pizza for pizza in menu.pizzas if id(pizza) not in removed_ids]
+        report.removed = [pizza.name for pizza in removals]
+    
+    menu.pizzas.extend(additions)
+    report.added = [pizza.name for pizza in additions]
+    
+    if report.has_changes():
+        menu.modified = True
+        menu.version += 1
+        if menu_file is not None:
+            report.saved = menu.save_to_file(menu_file)
+    
+    return report
@@ -0,0 +1,225 @@
+"""
+Menu Registry Module
+Serves per-store pizza menus from a bounded LRU cache
+"""
+
+import os
+import re
+import sys
+import weakref
+from collections import OrderedDict
+from typing import Dict, List
+from .pizza_types import PizzaMenu
+
+# Security constants
+MAX_STORE_ID_LENGTH = 64
+STORES_DIR = 'data/stores'
+
+# Default cache bounds
+DEFAULT_MAX_MENUS = 1000
+DEFAULT_MAX_MEMORY = 32 * 1024 * 1024  # 32MB
+
+_STORE_ID_PATTERN = re.compile(r'^[a-z0-9_\-]+$')
+
+class MenuRegistry:
+    """Loads store menus on first use and keeps the most recently used in memory
+    
+    Store ids are case-insensitive, since they map to file names. A menu
+    evicted while a caller still holds it is handed back by get_menu and
+    saved by save_all for as long as that reference is alive.
+    """
+    
+    def __init__(self, stores_dir: str = STORES_DIR,
+                 max_menus: int = DEFAULT_MAX_MENUS,
+                 max_memory: int = DEFAULT_MAX_MEMORY):
+        if max_menus <= 0:
+            raise ValueError("Maximum number of menus must be positive")
+        
+        if max_memory <= 0:
+            raise ValueError("Maximum memory must be positive")
+        
+        self.stores_dir = stores_dir
+        self.max_menus = max_menus
+        self.max_memory = max_memory
+        self._menus: 'OrderedDict[str, PizzaMenu]' = OrderedDict()
+        # Evicted menus still referenced by callers, so edits are not lost
+        self._detached: 'weakref.WeakValueDictionary[str, PizzaMenu]' = \
+            weakref.WeakValueDictionary()
+        self._sizes: Dict[str, int] = {}
+        self._memory_used = 0
+    
+    def _validate_store_id(self, store_id: str) -> str:
+        """Validate store id so it can be used as a file name"""
+        if not isinstance(store_id, str):
+            raise ValueError("Store id must be a string")
+        
+        # Lower-case so ids differing only in case never share one file
+        # as two separately cached menus on case-insensitive filesystems
+        store_id = store_id.strip().lower()
+        if not store_id:
+            raise ValueError("Store id cannot be empty")
+        
+        if len(store_id) > MAX_STORE_ID_LENGTH:
+            raise ValueError(f"Store id too long (max {MAX_STORE_ID_LENGTH} chars)")
+        
+        if not _STORE_ID_PATTERN.match(store_id):
+            raise ValueError("Store id contains invalid characters")
+        
+        return store_id
+    
+    def menu_path(self, store_id: str) -> str:
+        """Get the menu file path for a store"""
+        store_id = self._validate_store_id(store_id)
+        return os.path.join(self.stores_dir, store_id + '.json')
+    
+    def get_menu(self, store_id: str) -> PizzaMenu:
+        """Get an existing store's menu, loading it from file on first use
+        
+        Changes to a menu that has since been evicted are only kept while
+        the caller holds it, so call save_menu or save_all before dropping it.
+        """
+        store_id = self._validate_store_id(store_id)
+        
+        menu = self._menus.get(store_id)
+        if menu is not None:
+            self._menus.move_to_end(store_id)
+        else:
+            # Reuse an evicted menu a caller still holds instead of a stale copy
+            menu = self._detached.pop(store_id, None)
+            if menu is None:
+                menu = self._load_menu(store_id)
+            self._menus[store_id] = menu
+        
+        self._touch(store_id, menu)
+        return menu
+    
+    def _load_menu(self, store_id: str) -> PizzaMenu:
+        """Load a store's menu from its file"""
+        menu = PizzaMenu()
+        filename = self._safe_menu_path(menu, store_id)
+        if not os.path.exists(filename):
+            raise ValueError(f"Store '{store_id}' not found")
+        
+        # Never cache a menu that failed to load, or eviction would
+        # overwrite the store's file with the default pizzas
+        if not menu.load_from_file(filename):
+            raise ValueError(f"Could not load menu for store '{store_id}'")
+        
+        # load_from_file keeps the defaults when the file has no valid
+        # pizzas, but a store whose pizzas were all removed must stay empty
+        if menu._pizzas is None:
+            menu.pizzas = []
+        
+        return menu
+    
+    def create_store(self, store_id: str) -> PizzaMenu:
+        """Create a new store with the default menu and save it to file"""
+        store_id = self._validate_store_id(store_id)
+        
+        menu = PizzaMenu()
+        filename = self._safe_menu_path(menu, store_id)
+        if (store_id in self._menus or store_id in self._detached or
+                os.path.exists(filename)):
+            raise ValueError(f"Store '{store_id}' already exists")
+        
+        if not menu.save_to_file(filename):
+            raise ValueError(f"Could not save menu for store '{store_id}'")
+        
+        self._menus[store_id] = menu
+        self._touch(store_id, menu)
+        return menu
+    
+    def _safe_menu_path(self, menu: PizzaMenu, store_id: str) -> str:
+        """Get a store's menu file path, checked against the menu path rules"""
+        filename = self.menu_path(store_id)
+        if not menu._is_safe_path(filename):
+            raise ValueError("Invalid file path")
+        return filename
+    
+    def _touch(self, store_id: str, menu: PizzaMenu):
+        """Update a menu's size after use and evict others if over the limits"""
+        # Menus may have grown since last use, so re-measure before evicting
+        self._update_size(store_id, menu)
+        self._evict_over_limit()
+    
+    def save_menu(self, store_id: str) -> bool:
+        """Save a loaded or still referenced store menu if it has unsaved changes"""
+        store_id = self._validate_store_id(store_id)
+        
+        menu = self._menus.get(store_id)
+        if menu is None:
+            menu = self._detached.get(store_id)
+        if menu is None or not menu.modified:
+            return True
+        
+        return menu.save_to_file(self.menu_path(store_id))
+    
+    def save_all(self) -> bool:
+        """Save every loaded or still referenced menu that has unsaved changes"""
+        success = True
+        for store_id in list(self._menus) + list(self._detached.keys()):
+            if not self.save_menu(store_id):
+                success = False
+        return success
+    
+    def evict(self, store_id: str) -> bool:
+        """Remove a store menu from memory, saving it first if modified
+        
+        A menu whose changes cannot be saved stays loaded and False is returned.
+        """
+        store_id = self._validate_store_id(store_id)
+        if store_id not in self._menus:
+            return False
+        
+        if not self.save_menu(store_id):
+            print(f"Warning: Could not save menu for store '{store_id}', keeping it loaded.")
+            return False
+        
+        # Callers may still hold the menu; remember it without keeping it alive
+        self._detached[store_id] = self._menus.pop(store_id)
+        self._memory_used -= self._sizes.pop(store_id)
+        return True
+    
+    def _evict_over_limit(self):
+        """Evict least recently used menus until within count and memory limits"""
+        if self._within_limits():
+            return
+        
+        # The most recently used menu is always kept, and menus that could
+        # not be saved are skipped so their changes are not lost
+        for store_id in list(self._menus)[:-1]:
+            self.evict(store_id)
+            if self._within_limits():
+                break
+    
+    def _within_limits(self) -> bool:
+        """Check if loaded menus fit the count and memory limits"""
+        return (len(self._menus) <= self.max_menus and
+                self._memory_used <= self.max_memory)
+    
+    def _update_size(self, store_id: str, menu: PizzaMenu):
+        """Record the estimated memory footprint of a loaded menu"""
+        size = self._estimate_menu_size(menu)
+        self._memory_used += size - self._sizes.get(store_id, 0)
+        self._sizes[store_id] = size
+    
+    def _estimate_menu_size(self, menu: PizzaMenu) -> int:
+        """Estimate the memory used by a menu and its pizzas in bytes"""
+        size = sys.getsizeof(menu) + sys.getsizeof(menu.__dict__)
+        size += sys.getsizeof(menu.pizzas)
+        for pizza in menu.pizzas:
+            size += sys.getsizeof(pizza) + sys.getsizeof(pizza.__dict__)
+            size += sys.getsizeof(pizza.name) + sys.getsizeof(pizza.price)
+        return size
+    
+    def loaded_stores(self) -> List[str]:
+        """Get loaded store ids from least to most recently used"""
+        return list(self._menus)
+    
+    def memory_usage(self) -> int:
+        """Get estimated memory used by loaded menus in bytes"""
+        return self._memory_used
+    
+    def count(self) -> int:
+        """Get number of loaded menus"""
+        return len(self._menus)
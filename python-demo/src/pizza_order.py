@@ -3,10 +3,16 @@ Pizza Order Module
 Handles order creation and bill splitting with secure validation
 """
 
-from typing import List, Dict
+from __future__ import annotations
+
 from decimal import Decimal
 from .pizza_types import PizzaType, PizzaMenu, MAX_QUANTITY
 
+# Type-only import, kept out of the startup path like in pizza_types
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import List, Dict
+
 class OrderItem:
     """Represents a single item in an order"""
     
@@ -3,18 +3,38 @@ Pizza Types Module
 Handles pizza menu management with secure data validation
 """
 
+from __future__ import annotations
+
 import os
 import json
 import re
-from typing import List, Dict, Optional, Tuple
 from decimal import Decimal, InvalidOperation
 
+# typing is only needed by type checkers; importing it at runtime is a
+# noticeable share of startup time
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import List, Dict, Optional
+
 # Security constants
 MAX_PIZZA_NAME_LENGTH = 50
 MAX_PIZZA_TYPES = 20
 MAX_PRICE = Decimal('999.99')
 MIN_PRICE = Decimal('0.01')
 MAX_QUANTITY = 1000
+MAX_MENU_FILE_SIZE = 1024 * 1024  # 1MB limit
+
+# Allow only alphanumeric, spaces, and basic punctuation in names
+_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9\s\-\'\&\.]+$')
+
+DEFAULT_PIZZAS = (
+    ('Margherita', '10.00'),
+    ('Pepperoni', '12.50'),
+    ('Hawaiian', '13.00'),
+    ('Quattro Stagioni', '14.50'),
+    ('Vegetarian', '11.50'),
+    ('Meat Lovers', '16.00'),
+)
 
 class PizzaType:
     """Represents a single pizza type with validation"""
@@ -38,7 +58,7 @@ class PizzaType:
             raise ValueError(f"Pizza name too long (max {MAX_PIZZA_NAME_LENGTH} chars)")
         
         # Sanitize - allow only alphanumeric, spaces, and basic punctuation
-        if not re.match(r'^[a-zA-Z0-9\s\-\'\&\.]+$', name):
+        if not _NAME_PATTERN.match(name):
             raise ValueError("Pizza name contains invalid characters")
         
         return name
@@ -76,21 +96,33 @@ class PizzaMenu:
     """Manages the pizza menu with secure operations"""
     
     def __init__(self):
-        self.pizzas: List[PizzaType] = []
-        self._init_default_menu()
+        # Default pizzas are built on first access, so a menu that is
+        # immediately replaced by load_from_file never pays for them
+        self._pizzas: Optional[List[PizzaType]] = None
+        # True when the in-memory menu has changes not yet saved to a file
+        self.modified = False
+        # Incremented whenever pizzas or prices change, for cache invalidation
+        self.version = 0
+    
+    @property
+    def pizzas(self) -> List[PizzaType]:
+        """Pizza list, initialized with the default menu on first access"""
+        if self._pizzas is None:
+            # Building the defaults is not a change to the menu
+            modified, version = self.modified, self.version
+            self._pizzas = []
+            self._init_default_menu()
+            self.modified, self.version = modified, version
+        return self._pizzas
+    
+    @pizzas.setter
+    def pizzas(self, pizzas: List[PizzaType]):
+        self._pizzas = pizzas
+        self.version += 1
     
     def _init_default_menu(self):
         """Initialize with default pizza types"""
-        default_pizzas = [
-            ('Margherita', '10.00'),
-            ('Pepperoni', '12.50'),
-            ('Hawaiian', '13.00'),
-            ('Quattro Stagioni', '14.50'),
-            ('Vegetarian', '11.50'),
-            ('Meat Lovers', '16.00')
-        ]
-        
-        for name, price in default_pizzas:
+        for name, price in DEFAULT_PIZZAS:
             try:
                 self.add_pizza_type(name, Decimal(price))
             except ValueError as e:
@@ -107,6 +139,8 @@ class PizzaMenu:
         
         pizza = PizzaType(name, price)
         self.pizzas.append(pizza)
+        self.modified = True
+        self.version += 1
         return True
     
     def remove_pizza_type(self, name: str) -> bool:
@@ -116,6 +150,8 @@ class PizzaMenu:
             raise ValueError(f"Pizza type '{name}' not found")
         
         self.pizzas.remove(pizza)
+        self.modified = True
+        self.version += 1
         return True
     
     def find_pizza_by_name(self, name: str) -> Optional[PizzaType]:
@@ -154,7 +190,7 @@ class PizzaMenu:
                 return False
             
             # Check file size (prevent DoS)
-            if os.path.getsize(filename) > 1024 * 1024:  # 1MB limit
+            if os.path.getsize(filename) > MAX_MENU_FILE_SIZE:
                 raise ValueError("File too large")
             
             with open(filename, 'r', encoding='utf-8') as f:
@@ -177,6 +213,7 @@ class PizzaMenu:
             if new_pizzas:
                 self.pizzas = new_pizzas
             
+            self.modified = False
             return True
             
         except (json.JSONDecodeError, OSError, ValueError) as e:
@@ -202,6 +239,7 @@ class PizzaMenu:
             
             # Move to final location
             os.rename(temp_filename, filename)
+            self.modified = False
             return True
             
         except (OSError, ValueError) as e:
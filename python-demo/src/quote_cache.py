@@ -0,0 +1,122 @@
+"""
+Quote Cache Module
+Memoizes order totals and bill splits for repeated order shapes
+"""
+
+from collections import OrderedDict
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+from decimal import Decimal
+from .pizza_types import PizzaMenu, MAX_QUANTITY
+from .pizza_order import PizzaOrder
+
+DEFAULT_MAX_QUOTES = 1024
+
+class Quote(NamedTuple):
+    """Priced order total and per-person split, immutable so it can be shared"""
+    total_amount: Decimal
+    num_people: int
+    cost_per_person: Decimal
+    
+    def to_dict(self) -> Dict:
+        """Convert to dictionary"""
+        return {
+            'total_amount': str(self.total_amount),
+            'num_people': self.num_people,
+            'cost_per_person': str(self.cost_per_person)
+        }
+
+class QuoteCache:
+    """Bounded LRU cache of quotes for a single menu"""
+    
+    def __init__(self, menu: PizzaMenu, max_quotes: int = DEFAULT_MAX_QUOTES):
+        if max_quotes <= 0:
+            raise ValueError("Maximum number of quotes must be positive")
+        
+        self.menu = menu
+        self.max_quotes = max_quotes
+        self._quotes: 'OrderedDict[Tuple, Quote]' = OrderedDict()
+        self._menu_version = menu.version
+        self.hits = 0
+        self.misses = 0
+    
+    def quote(self, items: Iterable[Tuple[int, int]], num_people: int) -> Quote:
+        """Price (pizza ID, quantity) pairs split between num_people"""
+        # Any price or menu change makes every cached quote stale
+        if self.menu.version != self._menu_version:
+            self._quotes.clear()
+            self._menu_version = self.menu.version
+        
+        order_items, people = self._normalize(items, num_people)
+        key = self._fingerprint(order_items, people)
+        quote = self._quotes.get(key)
+        if quote is not None:
+            self._quotes.move_to_end(key)
+            self.hits += 1
+            return quote
+        
+        self.misses += 1
+        quote = self._compute_quote(order_items, people)
+        self._quotes[key] = quote
+        if len(self._quotes) > self.max_quotes:
+            self._quotes.popitem(last=False)
+        return quote
+    
+    def _normalize(self, items: Iterable[Tuple[int, int]],
+                   num_people: int) -> Tuple[List[Tuple[int, int]], int]:
+        """Convert order items and number of people to integers"""
+        try:
+            order_items = [(int(pizza_id), int(quantity)) for pizza_id, quantity in items]
+            people = int(num_people)
+        except (ValueError, TypeError):
+            raise ValueError("Pizza IDs, quantities and number of people must be integers")
+        
+        # Checked per item before lookup, since the cache key sums repeated IDs
+        for _, quantity in order_items:
+            if quantity <= 0:
+                raise ValueError("Quantity must be positive")
+            if quantity > MAX_QUANTITY:
+                raise ValueError(f"Quantity too large (max {MAX_QUANTITY})")
+        
+        return order_items, people
+    
+    def _fingerprint(self, items: List[Tuple[int, int]], num_people: int) -> Tuple:
+        """Build a canonical cache key that ignores item order and repeated IDs"""
+        quantities: Dict[int, int] = {}
+        for pizza_id, quantity in items:
+            quantities[pizza_id] = quantities.get(pizza_id, 0) + quantity
+        
+        return (self._menu_version, tuple(sorted(quantities.items())), num_people)
+    
+    def _compute_quote(self, items: List[Tuple[int, int]], num_people: int) -> Quote:
+        """Price an order using the same validation as PizzaOrder"""
+        order = PizzaOrder()
+        for pizza_id, quantity in items:
+            pizza = self.menu.get_pizza_by_index(pizza_id)
+            if pizza is None:
+                raise ValueError(f"Invalid pizza ID: {pizza_id}")
+            order.add_item(pizza, quantity)
+        
+        if order.item_count() == 0:
+            raise ValueError("No items in order")
+        
+        order.set_num_people(num_people)
+        return Quote(order.total_amount, order.num_people, order.get_cost_per_person())
+    
+    def clear(self):
+        """Remove all cached quotes"""
+        self._quotes.clear()
+    
+    def stats(self) -> Dict:
+        """Get cache hit/miss statistics"""
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._quotes),
+            'max_quotes': self.max_quotes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+    
+    def count(self) -> int:
+        """Get number of cached quotes"""
+        return len(self._quotes)